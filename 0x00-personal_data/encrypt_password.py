@@ -3,9 +3,40 @@
 """
 This module provides functions for hashing
 and validating passwords using bcrypt.
+
+The bcrypt cost factor can be tuned with the BCRYPT_COST environment
+variable. When a PASSWORD_PEPPER is configured, an HMAC-SHA256 digest
+of the password is stored next to the bcrypt hash so that wrong
+passwords can be rejected with a single cheap HMAC comparison instead
+of a full bcrypt round.
 """
 
 import bcrypt
+import hashlib
+import hmac
+import os
+
+
+try:
+    _COST: int = int(os.environ.get('BCRYPT_COST', '12'))
+except ValueError:
+    _COST = 12
+_PEPPER: bytes = os.environ.get('PASSWORD_PEPPER', '').encode('utf-8')
+_HMAC_SEPARATOR: bytes = b'$hmac$'
+
+
+def _password_hmac(byte_password: bytes) -> bytes:
+    """
+    Computes the HMAC-SHA256 digest of a password with the pepper.
+
+    Args:
+        byte_password (bytes): The password to digest.
+
+    Returns:
+        bytes: The hex-encoded HMAC digest.
+    """
+    return hmac.new(_PEPPER, byte_password,
+                    hashlib.sha256).hexdigest().encode('ascii')
 
 
 def hash_password(password: str) -> bytes:
@@ -16,11 +47,16 @@ def hash_password(password: str) -> bytes:
         password (str): The password to be hashed.
 
     Returns:
-        bytes: The hashed password.
+        bytes: The hashed password. When a pepper is configured, the
+            HMAC digest is prepended to the bcrypt hash.
 
     """
     byte_password = bytes(password, 'utf-8')
-    return bcrypt.hashpw(byte_password, bcrypt.gensalt())
+    hashed = bcrypt.hashpw(byte_password, bcrypt.gensalt(rounds=_COST))
+
+    if _PEPPER:
+        return _password_hmac(byte_password) + _HMAC_SEPARATOR + hashed
+    return hashed
 
 
 def is_valid(hashed_password: bytes, password: str) -> bool:
@@ -36,4 +72,11 @@ def is_valid(hashed_password: bytes, password: str) -> bool:
 
     """
     byte_password = bytes(password, 'utf-8')
+
+    if _HMAC_SEPARATOR in hashed_password:
+        digest, _, hashed_password = hashed_password.partition(
+            _HMAC_SEPARATOR)
+        if not hmac.compare_digest(digest, _password_hmac(byte_password)):
+            return False
+
     return bcrypt.checkpw(byte_password, hashed_password)
@@ -11,16 +11,82 @@ setting up a logger, retrieving and logging user data from a database.
 Author: [Fabrice Eklou]
 """
 
+import copy
 import logging
-from typing import List, Tuple
+from functools import lru_cache
+from typing import List, Pattern, Tuple
 import re
 import mysql.connector
+import mysql.connector.pooling
 import os
 
+try:
+    import re2 as _regex_engine
+except ImportError:
+    _regex_engine = re
+
 
 PII_FIELDS: Tuple[str] = ('name', 'email', 'phone', 'ssn', 'password')
 
 
+@lru_cache(maxsize=None)
+def _redaction_pattern(fields: Tuple[str, ...],
+                       separator: str) -> Pattern[str]:
+    """
+    Build and cache the combined redaction regex for a field set.
+
+    Args:
+        fields (Tuple[str, ...]): The sensitive fields to be redacted.
+        separator (str): The separator used to separate field-value pairs.
+
+    Returns:
+        Pattern[str]: A compiled pattern matching any `field=value` pair.
+    """
+    return _regex_engine.compile('({})=[^{}]*'.format(
+        '|'.join(re.escape(field) for field in fields),
+        re.escape(separator)))
+
+
+def _redact_single_pass(prefixes: Tuple[str, ...], redaction: str,
+                        message: str, separator: str) -> str:
+    """
+    Redact field values in one forward scan without a regex engine.
+
+    Args:
+        prefixes (Tuple[str, ...]): The `field=` prefixes to redact.
+        redaction (str): The string to be used for redaction.
+        message (str): The message containing sensitive data.
+        separator (str): The separator used to separate field-value pairs.
+
+    Returns:
+        str: The message with sensitive data redacted.
+    """
+    chunks = []
+    position = 0
+    length = len(message)
+
+    while position < length:
+        start = -1
+        prefix_len = 0
+        for prefix in prefixes:
+            index = message.find(prefix, position)
+            if index != -1 and (start == -1 or index < start):
+                start = index
+                prefix_len = len(prefix)
+        if start == -1:
+            chunks.append(message[position:])
+            break
+
+        end = message.find(separator, start + prefix_len)
+        if end == -1:
+            end = length
+        chunks.append(message[position:start + prefix_len])
+        chunks.append(redaction)
+        position = end
+
+    return ''.join(chunks)
+
+
 def filter_datum(fields: List[str], redaction: str,
                  message: str, separator: str) -> str:
     """
@@ -35,11 +101,12 @@ def filter_datum(fields: List[str], redaction: str,
     Returns:
         str: The message with sensitive data redacted.
     """
-    for field in fields:
-        message = re.sub(pattern='{}=.*?{}'.format(field, separator),
-                         repl='{}={}{}'.format(field, redaction, separator),
-                         string=message)
-    return message
+    if '=' not in message:
+        return message
+
+    pattern = _redaction_pattern(tuple(fields), separator)
+    return pattern.sub(lambda match: '{}={}'.format(
+        match.group(1), redaction), message)
 
 
 class RedactingFormatter(logging.Formatter):
@@ -60,7 +127,9 @@ class RedactingFormatter(logging.Formatter):
             None
         """
         super(RedactingFormatter, self).__init__(self.FORMAT)
-        self.__fields = fields
+        self.__fields = tuple(fields)
+        self.__prefixes = tuple(
+            '{}='.format(field) for field in self.__fields)
 
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -73,8 +142,12 @@ class RedactingFormatter(logging.Formatter):
             str: The formatted log record with sensitive data filtered.
 
         """
-        record.msg = filter_datum(self.__fields, self.REDACTION,
-                                  record.msg, self.SEPARATOR)
+        message = _redact_single_pass(self.__prefixes, self.REDACTION,
+                                      record.getMessage(), self.SEPARATOR)
+
+        record = copy.copy(record)
+        record.msg = message
+        record.args = None
         return super(RedactingFormatter, self).format(record)
 
 
@@ -96,27 +169,46 @@ def get_logger() -> logging.Logger:
     return user_data_logger
 
 
+_CONNECTION_POOL = None
+
+
 def get_db() -> mysql.connector.connection.MySQLConnection:
     """
-    Get a connection to the database.
+    Get a connection to the database from a shared pool.
+
+    The pool is created on first use, so repeated calls reuse
+    already-established connections instead of paying a new TCP and
+    authentication handshake each time.
 
     Returns:
         mysql.connector.connection.MySQLConnection:
             The database connection.
     """
-    username = os.environ.get("PERSONAL_DATA_DB_USERNAME", "root")
-    password = os.environ.get("PERSONAL_DATA_DB_PASSWORD", "")
-    host = os.environ.get("PERSONAL_DATA_DB_HOST", "localhost")
-    db_name = os.environ.get("PERSONAL_DATA_DB_NAME")
+    global _CONNECTION_POOL
+
+    if _CONNECTION_POOL is None:
+        username = os.environ.get("PERSONAL_DATA_DB_USERNAME", "root")
+        password = os.environ.get("PERSONAL_DATA_DB_PASSWORD", "")
+        host = os.environ.get("PERSONAL_DATA_DB_HOST", "localhost")
+        db_name = os.environ.get("PERSONAL_DATA_DB_NAME")
+
+        config = {
+            'pool_name': 'user_data',
+            'pool_size': 8,
+            'user': username,
+            'password': password,
+            'host': host,
+            'database': db_name,
+        }
 
-    connection = mysql.connector.connection.MySQLConnection(
-        user=username,
-        password=password,
-        host=host,
-        database=db_name
-    )
+        try:
+            _CONNECTION_POOL = mysql.connector.pooling.MySQLConnectionPool(
+                use_pure=False, **config)
+        except ImportError:
+            _CONNECTION_POOL = mysql.connector.pooling.MySQLConnectionPool(
+                use_pure=True, **config)
 
-    return connection
+    return _CONNECTION_POOL.get_connection()
 
 
 def main() -> None:
@@ -125,19 +217,29 @@ def main() -> None:
     """
     connection = get_db()
 
-    with connection.cursor() as cursor:
+    with connection.cursor(buffered=False) as cursor:
         cursor.execute('SELECT * FROM users;')
-        log_rows = cursor.fetchall()
         fields = ('name', 'email', 'phone', 'ssn',
                   'password', 'ip', 'last_login', 'user_agent')
-        for log_row in log_rows:
-            field_value = zip(fields, log_row)
-            message = ' '.join(
-                ['{}={};'.format(field, value)
-                 for field, value in field_value])
-            logger = logging.LogRecord('user_data', logging.INFO, None, None,
-                                       message, None, None)
-            print(RedactingFormatter(PII_FIELDS).format(logger))
+        field_prefixes = tuple('{}='.format(field) for field in fields)
+        formatter = RedactingFormatter(PII_FIELDS)
+        record = logging.LogRecord('user_data', logging.INFO,
+                                   None, None, '', None, None)
+        while True:
+            log_rows = cursor.fetchmany(size=1000)
+            if not log_rows:
+                break
+            messages = [
+                ' '.join(prefix + str(value) + ';'
+                         for prefix, value in zip(field_prefixes, log_row))
+                for log_row in log_rows]
+            redacted = filter_datum(PII_FIELDS,
+                                    RedactingFormatter.REDACTION,
+                                    '\n'.join(messages),
+                                    RedactingFormatter.SEPARATOR)
+            header = formatter.format(record)
+            print('\n'.join(header + line
+                            for line in redacted.split('\n')))
         cursor.close()
     connection.close()
 
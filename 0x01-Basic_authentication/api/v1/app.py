@@ -7,7 +7,7 @@ Route module for the API
 import os
 from os import getenv
 from api.v1.views import app_views
-from flask import Flask, jsonify, abort, request
+from flask import Flask, g, jsonify, abort, request
 from flask_cors import (CORS, cross_origin)
 from api.v1.auth.auth import Auth
 from api.v1.auth.basic_auth import BasicAuth
@@ -20,33 +20,40 @@ CORS(app, resources={r"/api/v1/*": {"origins": "*"}})
 auth = None
 AUTH_TYPE = os.environ.get('AUTH_TYPE', None)
 auth_choices = {'auth': Auth, 'basic_auth': BasicAuth}
+EXCLUDED_PATHS = frozenset({'/api/v1/status/', '/api/v1/unauthorized/',
+                            '/api/v1/forbidden/'})
 
 if AUTH_TYPE in auth_choices:
     auth = auth_choices[AUTH_TYPE]()
 
-
-@app.before_request
-def before_request():
-    """
-    Performs actions before each request is processed.
-
-    This function checks if the request path requires authentication
-    and authorization.
-    If authentication is required, it checks if the request
-    has a valid authorization header.
-    If authorization is required, it checks if the current user has
-    the necessary permissions.
-    If any of the checks fail, it aborts the request with
-    the appropriate HTTP status code.
-    """
-    paths = ['/api/v1/status/', '/api/v1/unauthorized/', '/api/v1/forbidden/']
-    if auth is None:
-        return
-    if auth.require_auth(request.path, paths):
-        if auth.authorization_header(request) is None:
-            abort(401)
-        if auth.current_user(request) is None:
-            abort(403)
+if auth is not None:
+    _require_auth = auth.require_auth
+    _authorization_header = auth.authorization_header
+    _current_user = auth.current_user
+    _extract_credentials = getattr(auth, 'extract_credentials', None)
+
+    @app.before_request
+    def before_request():
+        """
+        Performs actions before each request is processed.
+
+        This function checks if the request path requires authentication
+        and authorization.
+        If authentication is required, it checks if the request
+        has a valid authorization header.
+        If authorization is required, it checks if the current user has
+        the necessary permissions.
+        If any of the checks fail, it aborts the request with
+        the appropriate HTTP status code.
+        """
+        if _require_auth(request.path, EXCLUDED_PATHS):
+            auth_header = _authorization_header(request)
+            if auth_header is None:
+                abort(401)
+            if _extract_credentials is not None:
+                g.basic_auth_credentials = _extract_credentials(auth_header)
+            if _current_user(request) is None:
+                abort(403)
 
 
 @app.errorhandler(404)
@@ -42,20 +42,23 @@ class Auth:
         if len(path) > 0 and path[-1] != "/":
             path = path + '/'
 
-        _excluded_stars_paths = []
-        _excluded_paths = []
-        for excluded_path in excluded_paths:
-            if len(excluded_path) > 0 and excluded_path[-1] == '*':
-                _excluded_stars_paths.append(excluded_path[:-1])
-            else:
-                _excluded_paths.append(excluded_path)
-
-        for p in _excluded_stars_paths:
-            if path.startswith(p):
-                return False
-        for p in _excluded_paths:
-            if p == path:
-                return False
+        key = tuple(excluded_paths)
+        cached = getattr(self, '_compiled_excluded_paths', None)
+        if cached is None or cached[0] != key:
+            exact = frozenset(
+                p for p in key
+                if len(p) == 0 or p[-1] != '*')
+            prefixes = tuple(
+                p[:-1] for p in key
+                if len(p) > 0 and p[-1] == '*')
+            cached = (key, exact, prefixes)
+            self._compiled_excluded_paths = cached
+
+        _, exact, prefixes = cached
+        if path in exact:
+            return False
+        if prefixes and path.startswith(prefixes):
+            return False
         return True
 
     def authorization_header(self, _request=None) -> str:
@@ -5,12 +5,43 @@ This module provides the BasicAuth class which is a subclass of Auth.
 It handles basic authentication for the API.
 """
 
-import base64
 import binascii
+import re
 from api.v1.auth.auth import Auth
+from functools import lru_cache
 from typing import Tuple, TypeVar
 from models.user import User
-from flask import request
+from flask import g, request
+
+
+_BASIC_PREFIX = 'Basic '
+_BASIC_PREFIX_LEN = len(_BASIC_PREFIX)
+_BASE64_PATTERN = re.compile(r'[A-Za-z0-9+/]*={0,2}')
+
+
+@lru_cache(maxsize=4096)
+def _search_users_by_email(user_email: str) -> Tuple[TypeVar('User'), ...]:
+    """
+    Memoized lookup of users by email address.
+
+    Args:
+        user_email (str): The email address to search for.
+
+    Returns:
+        Tuple[User, ...]: The users matching the email address.
+    """
+    return tuple(User.search({'email': user_email}))
+
+
+def invalidate_user_search_cache() -> None:
+    """
+    Drops the memoized email lookups, to be called after user
+    creation, update or removal.
+
+    Returns:
+        None
+    """
+    _search_users_by_email.cache_clear()
 
 
 class BasicAuth(Auth):
@@ -30,12 +61,10 @@ class BasicAuth(Auth):
             str: The base64 encoded authorization header.
 
         """
-        prefix = 'Basic '
-        if not isinstance(authorization_header, str):
-            return None
-        if not authorization_header.startswith(prefix):
+        if type(authorization_header) is not str or \
+                not authorization_header.startswith(_BASIC_PREFIX):
             return None
-        return authorization_header[len(prefix):]
+        return authorization_header[_BASIC_PREFIX_LEN:]
 
     def decode_base64_authorization_header(
             self,
@@ -55,13 +84,14 @@ class BasicAuth(Auth):
         """
         if not isinstance(base64_authorization_header, str):
             return None
+        if not _BASE64_PATTERN.fullmatch(base64_authorization_header):
+            return None
 
         try:
-            decoded_base64 = base64.b64decode(
-                base64_authorization_header,
-                validate=True)
+            decoded_base64 = binascii.a2b_base64(
+                base64_authorization_header)
             return decoded_base64.decode('utf-8')
-        except (binascii.Error, UnicodeDecodeError):
+        except (binascii.Error, ValueError, UnicodeDecodeError):
             return None
 
     def extract_user_credentials(
@@ -81,15 +111,14 @@ class BasicAuth(Auth):
                 If the authorization header is not in the correct format,
                 returns (None, None).
         """
-        separator = ':'
         if not isinstance(decoded_base64_authorization_header, str):
             return None, None
-        if separator not in decoded_base64_authorization_header:
-            return None, None
 
-        decoded_base64 = decoded_base64_authorization_header
-        index = decoded_base64.find(separator)
-        return decoded_base64[:index], decoded_base64[index + 1:]
+        user_email, separator, user_pwd = \
+            decoded_base64_authorization_header.partition(':')
+        if not separator:
+            return None, None
+        return user_email, user_pwd
 
     def user_object_from_credentials(self,
                                      user_email: str,
@@ -110,7 +139,7 @@ class BasicAuth(Auth):
             return None
 
         try:
-            users = User.search({'email': user_email})
+            users = _search_users_by_email(user_email)
         except (ValueError, TypeError, KeyError):
             return None
 
@@ -118,10 +147,37 @@ class BasicAuth(Auth):
             if valid_user.is_valid_password(user_pwd):
                 return valid_user
 
+    def extract_credentials(self,
+                            authorization_header: str) -> Tuple[str, str]:
+        """
+        Parses a raw authorization header value into user credentials.
+
+        Args:
+            authorization_header (str): The authorization header value.
+
+        Returns:
+            Tuple[str, str]: The username and password, or (None, None)
+                if the header is missing or malformed.
+        """
+        base64_auth = self.extract_base64_authorization_header(
+            authorization_header)
+
+        if base64_auth is None:
+            return None, None
+        decoded_base64 = self.decode_base64_authorization_header(base64_auth)
+
+        if decoded_base64 is None:
+            return None, None
+        return self.extract_user_credentials(decoded_base64)
+
     def current_user(self, request=None) -> TypeVar('User'):
         """
         Retrieves the current user based on the provided request.
 
+        Credentials already parsed by the before_request hook (stored
+        on flask.g) are reused, so the header is decoded only once per
+        request.
+
         Args:
             request (Optional[Request]): The request object containing
                 the authorization header. If not provided,
@@ -133,19 +189,18 @@ class BasicAuth(Auth):
                 None if the authorization header is missing or invalid.
 
         """
-        auth_header = self.authorization_header(request)
-
-        if auth_header is None:
-            return None
-        base64_auth = self.extract_base64_authorization_header(auth_header)
-
-        if base64_auth is None:
-            return None
-        decoded_base64 = self.decode_base64_authorization_header(base64_auth)
+        credentials = None
+        try:
+            credentials = g.get('basic_auth_credentials')
+        except RuntimeError:
+            pass
 
-        if decoded_base64 is None:
-            return None
-        user_name, user_pwd = self.extract_user_credentials(decoded_base64)
+        if credentials is None:
+            auth_header = self.authorization_header(request)
+            if auth_header is None:
+                return None
+            credentials = self.extract_credentials(auth_header)
 
+        user_name, user_pwd = credentials
         if user_name and user_pwd:
             return self.user_object_from_credentials(user_name, user_pwd)
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """ Module of Users views
 """
+from api.v1.auth.basic_auth import invalidate_user_search_cache
 from api.v1.views import app_views
 from flask import abort, jsonify, request
 from models.user import User
@@ -48,6 +49,7 @@ def delete_user(user_id: str = None) -> str:
     if user is None:
         abort(404)
     user.remove()
+    invalidate_user_search_cache()
     return jsonify({}), 200
 
 
@@ -83,6 +85,7 @@ def create_user() -> str:
             user.first_name = rj.get("first_name")
             user.last_name = rj.get("last_name")
             user.save()
+            invalidate_user_search_cache()
             return jsonify(user.to_json()), 201
         except Exception as e:
             error_msg = "Can't create User: {}".format(e)
@@ -119,4 +122,5 @@ def update_user(user_id: str = None) -> str:
     if rj.get('last_name') is not None:
         user.last_name = rj.get('last_name')
     user.save()
+    invalidate_user_search_cache()
     return jsonify(user.to_json()), 200
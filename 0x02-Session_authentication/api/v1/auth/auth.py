@@ -9,6 +9,9 @@ from flask import request
 import os
 
 
+SESSION_COOKIE_NAME = os.environ.get('SESSION_NAME')
+
+
 class Auth:
     """
     Auth class handles authentication and authorization for the API.
@@ -100,5 +103,4 @@ class Auth:
         if request is None:
             return None
 
-        cookie_name = os.environ.get('SESSION_NAME')
-        return request.cookies.get(cookie_name)
+        return request.cookies.get(SESSION_COOKIE_NAME)
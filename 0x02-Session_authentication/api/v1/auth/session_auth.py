@@ -6,10 +6,221 @@ for handling session-based authentication.
 """
 
 from api.v1.auth.auth import Auth
-from uuid import uuid4
+from collections import OrderedDict
+from datetime import datetime
 from models.user import User
 from api.v1.views import app_views
 from flask import request, jsonify, make_response
+import json
+import os
+import threading
+import time
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+
+try:
+    _USER_CACHE_TTL = float(os.environ.get('USER_CACHE_TTL', 30))
+except ValueError:
+    _USER_CACHE_TTL = 30.0
+
+_user_cache = {}
+
+
+def _cached_user(user_id):
+    """
+    Resolves a user by ID through a short-TTL cache.
+
+    Active sessions hit current_user on every request; caching the
+    resolved User for USER_CACHE_TTL seconds (default 30) keeps the
+    backing store out of the steady-state request path while bounding
+    how long a profile update can stay invisible.
+
+    Args:
+        user_id: The ID of the user to resolve.
+
+    Returns:
+        User: The user with this ID, or None.
+    """
+    entry = _user_cache.get(user_id)
+    now = time.monotonic()
+    if entry is not None and entry[1] > now:
+        return entry[0]
+
+    user = User.get(user_id)
+    _user_cache[user_id] = (user, now + _USER_CACHE_TTL)
+    return user
+
+
+_TOKEN_BLOCK_SIZE = 4096
+_token_block = b''
+_token_position = _TOKEN_BLOCK_SIZE
+_token_lock = threading.Lock()
+
+
+def _generate_session_id() -> str:
+    """
+    Generates a 32-character hex session ID from buffered entropy.
+
+    A 4 KiB block of urandom bytes is drawn at once and sliced into
+    16-byte IDs, so one getrandom syscall covers 256 sessions instead
+    of one syscall (plus UUID object construction) per session.
+
+    Returns:
+        str: The session ID.
+    """
+    global _token_block, _token_position
+
+    with _token_lock:
+        if _token_position + 16 > len(_token_block):
+            _token_block = os.urandom(_TOKEN_BLOCK_SIZE)
+            _token_position = 0
+        raw = _token_block[_token_position:_token_position + 16]
+        _token_position += 16
+
+    return raw.hex()
+
+
+class _LRUSessionDict(OrderedDict):
+    """
+    Bounded in-memory session mapping with LRU eviction.
+
+    Reads and writes move the session to the most-recently-used end;
+    once the mapping exceeds its maximum size the least-recently-used
+    session is evicted, so a long-running process never accumulates
+    stale sessions without bound.
+
+    Mutations are serialized with a lock so concurrent requests under
+    a threaded server (threaded=True, Waitress) cannot interleave an
+    eviction with an insert; plain membership reads stay lock-free,
+    as single dict lookups are atomic under the CPython GIL.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Initializes an empty mapping bounded to maxsize entries.
+
+        Args:
+            maxsize (int): The maximum number of sessions retained.
+        """
+        super().__init__()
+        self.__maxsize = maxsize
+        self.__lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """ Return the value for key, refreshing its recency.
+        """
+        with self.__lock:
+            if key not in self:
+                return default
+            self.move_to_end(key)
+            return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        """ Store a value, evicting the oldest entries when full.
+        """
+        with self.__lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            while len(self) > self.__maxsize:
+                self.popitem(last=False)
+
+    def __delitem__(self, key):
+        """ Remove a session under the write lock.
+        """
+        with self.__lock:
+            super().__delitem__(key)
+
+
+class _RedisSessionStore:
+    """
+    Dict-like session mapping backed by Redis.
+
+    Sessions are shared across worker processes and expired
+    automatically by Redis when a SESSION_DURATION is configured,
+    so the store never grows unboundedly in any single worker.
+    """
+
+    _KEY_PREFIX = 'session:'
+
+    def __init__(self, url: str):
+        """
+        Initializes the store from a Redis URL.
+
+        Args:
+            url (str): The Redis connection URL.
+        """
+        self.__redis = redis.Redis.from_url(url, decode_responses=True)
+        try:
+            self.__ttl = int(os.environ.get('SESSION_DURATION', 0))
+        except ValueError:
+            self.__ttl = 0
+
+    def __serialize(self, value) -> str:
+        """ Encode a session value (user id or session dict) as JSON.
+        """
+        return json.dumps(value, default=str)
+
+    def __deserialize(self, raw: str):
+        """ Decode a stored session value, restoring datetimes.
+        """
+        value = json.loads(raw)
+        if isinstance(value, dict) and isinstance(
+                value.get('created_at'), str):
+            value['created_at'] = datetime.fromisoformat(
+                value['created_at'])
+        return value
+
+    def get(self, session_id, default=None):
+        """ Return the value stored for a session ID.
+        """
+        raw = self.__redis.get(self._KEY_PREFIX + str(session_id))
+        if raw is None:
+            return default
+        return self.__deserialize(raw)
+
+    def __contains__(self, session_id) -> bool:
+        """ Check whether a session ID is stored.
+        """
+        return bool(self.__redis.exists(self._KEY_PREFIX + str(session_id)))
+
+    def __setitem__(self, session_id, value):
+        """ Store a session value, with TTL when sessions expire.
+        """
+        key = self._KEY_PREFIX + str(session_id)
+        if self.__ttl > 0:
+            self.__redis.setex(key, self.__ttl, self.__serialize(value))
+        else:
+            self.__redis.set(key, self.__serialize(value))
+
+    def __delitem__(self, session_id):
+        """ Remove a session from the store.
+        """
+        if not self.__redis.delete(self._KEY_PREFIX + str(session_id)):
+            raise KeyError(session_id)
+
+
+def _session_store():
+    """
+    Builds the session store shared by all SessionAuth instances.
+
+    Returns:
+        The Redis-backed store when SESSION_REDIS_URL is configured
+        and the redis package is installed, an LRU-bounded in-memory
+        mapping otherwise.
+    """
+    url = os.environ.get('SESSION_REDIS_URL')
+    if url and redis is not None:
+        return _RedisSessionStore(url)
+
+    try:
+        maxsize = int(os.environ.get('SESSION_CACHE_MAX', 10000))
+    except ValueError:
+        maxsize = 10000
+    return _LRUSessionDict(maxsize)
 
 
 class SessionAuth(Auth):
@@ -30,7 +241,7 @@ class SessionAuth(Auth):
             Retrieves the user ID associated with a given session ID.
     """
 
-    user_id_by_session_id = {}
+    user_id_by_session_id = _session_store()
 
     def create_session(self, user_id: str = None) -> str:
         """
@@ -45,7 +256,7 @@ class SessionAuth(Auth):
         if not isinstance(user_id, str):
             return None
 
-        session_id = str(uuid4())
+        session_id = _generate_session_id()
         self.user_id_by_session_id[session_id] = user_id
 
         return session_id
@@ -79,7 +290,7 @@ class SessionAuth(Auth):
         """
         s_cookie = self.session_cookie(request)
         user_id = self.user_id_for_session_id(s_cookie)
-        return User.get(user_id)
+        return _cached_user(user_id)
 
     def destroy_session(self, request=None):
         """
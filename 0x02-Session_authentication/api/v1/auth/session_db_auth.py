@@ -21,8 +21,79 @@ Methods:
 """
 
 from api.v1.auth.session_exp_auth import SessionExpAuth
+from models.base import DATA
 from models.user_session import UserSession
 from datetime import datetime, timedelta
+import atexit
+import os
+import threading
+
+
+try:
+    _FLUSH_INTERVAL = float(os.environ.get('SESSION_FLUSH_INTERVAL', 5))
+except ValueError:
+    _FLUSH_INTERVAL = 5.0
+
+_sessions_by_id = None
+_flush_lock = threading.Lock()
+_flush_timer = None
+_flush_pending = False
+
+
+def _load_sessions() -> dict:
+    """
+    Loads persisted sessions once and returns the in-memory index.
+
+    The JSON session file is read a single time per process; all
+    subsequent lookups are O(1) dict probes on the session_id index.
+
+    Returns:
+        dict: The session_id to UserSession mapping.
+    """
+    global _sessions_by_id
+
+    if _sessions_by_id is None:
+        UserSession.load_from_file()
+        _sessions_by_id = {
+            session.session_id: session
+            for session in UserSession.all()}
+    return _sessions_by_id
+
+
+def _flush_sessions() -> None:
+    """
+    Writes buffered session changes to the JSON file, if any.
+    """
+    global _flush_timer, _flush_pending
+
+    with _flush_lock:
+        _flush_timer = None
+        if not _flush_pending:
+            return
+        _flush_pending = False
+    UserSession.save_to_file()
+
+
+def _schedule_flush() -> None:
+    """
+    Marks the session store dirty and arms the flush timer.
+
+    Writes made within one flush interval are persisted together by a
+    single save_to_file call instead of one file rewrite per login or
+    logout.
+    """
+    global _flush_timer, _flush_pending
+
+    with _flush_lock:
+        _flush_pending = True
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(_FLUSH_INTERVAL,
+                                           _flush_sessions)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+
+atexit.register(_flush_sessions)
 
 
 class SessionDBAuth(SessionExpAuth):
@@ -58,8 +129,12 @@ class SessionDBAuth(SessionExpAuth):
         if session_id is None:
             return None
 
+        sessions = _load_sessions()
         user_session = UserSession(user_id=user_id, session_id=session_id)
-        user_session.save()
+        user_session.updated_at = datetime.utcnow()
+        DATA[UserSession.__name__][user_session.id] = user_session
+        sessions[session_id] = user_session
+        _schedule_flush()
 
         return session_id
 
@@ -77,13 +152,11 @@ class SessionDBAuth(SessionExpAuth):
         if session_id is None:
             return None
 
-        UserSession.load_from_file()
-        users = UserSession.search({'session_id': session_id})
+        valid_user = _load_sessions().get(session_id)
 
-        if not users:
+        if valid_user is None:
             return None
 
-        valid_user = users[0]
         session_created_at = valid_user.created_at
 
         if session_created_at is None:
@@ -108,20 +181,14 @@ class SessionDBAuth(SessionExpAuth):
         """
         session_id = self.session_cookie(request)
 
-        if session_id is None or self.user_id_for_session_id(session_id):
-            return False
-
-        sessions = UserSession.search({'session_id': session_id})
-
-        if not sessions:
+        if session_id is None:
             return False
 
-        session = sessions[0]
+        session = _load_sessions().pop(session_id, None)
 
-        try:
-            session.remove()
-            UserSession.save_to_file()
-        except Exception:
+        if session is None:
             return False
 
+        DATA[UserSession.__name__].pop(session.id, None)
+        _schedule_flush()
         return True
@@ -27,7 +27,13 @@ Usage:
 
 from api.v1.auth.session_auth import SessionAuth
 import os
-from datetime import datetime, timedelta
+import time
+
+
+try:
+    _SESSION_DURATION = int(os.environ.get('SESSION_DURATION', 0))
+except ValueError:
+    _SESSION_DURATION = 0
 
 
 class SessionExpAuth(SessionAuth):
@@ -62,17 +68,19 @@ class SessionExpAuth(SessionAuth):
 
         The `__init__` method is called when a new instance of the
         SessionExpAuth class is created.
-        It initializes the session duration based on the value of
-        the `SESSION_DURATION` environment variable.
+        It initializes the session duration from the module constant
+        parsed once at import from the `SESSION_DURATION` environment
+        variable, and specializes the session lookup for the instance:
+        when expiration is disabled the no-expiry variant is bound so
+        every request skips the dead expiry branch entirely.
         """
-        duration = os.environ.get('SESSION_DURATION', 0)
-
-        try:
-            duration = int(duration)
-        except ValueError:
-            duration = 0
-
-        self.session_duration = duration
+        self.session_duration = _SESSION_DURATION
+        if (type(self).user_id_for_session_id
+                is SessionExpAuth.user_id_for_session_id):
+            if self.session_duration <= 0:
+                self.user_id_for_session_id = self._lookup_no_exp
+            else:
+                self.user_id_for_session_id = self._lookup_with_exp
 
     def create_session(self, user_id=None):
         """
@@ -90,10 +98,7 @@ class SessionExpAuth(SessionAuth):
         if session_id is None:
             return None
 
-        self.user_id_by_session_id[session_id] = {}
-        session_dictionary = self.user_id_by_session_id[session_id]
-        session_dictionary['user_id'] = user_id
-        session_dictionary['created_at'] = datetime.now()
+        self.user_id_by_session_id[session_id] = (user_id, time.monotonic())
 
         return session_id
 
@@ -101,6 +106,43 @@ class SessionExpAuth(SessionAuth):
         """
         Retrieves the user ID associated with the specified session ID.
 
+        Dispatches to the variant selected in `__init__`; subclasses
+        that override this method are left untouched.
+
+        Args:
+            session_id (str): The ID of the session.
+
+        Returns:
+            str: The user ID associated with the session if it is valid
+                and not expired, None otherwise.
+        """
+        if self.session_duration <= 0:
+            return self._lookup_no_exp(session_id)
+        return self._lookup_with_exp(session_id)
+
+    def _lookup_no_exp(self, session_id=None):
+        """
+        Session lookup for the no-expiry configuration.
+
+        Args:
+            session_id (str): The ID of the session.
+
+        Returns:
+            str: The user ID associated with the session, None otherwise.
+        """
+        if session_id is None:
+            return None
+
+        session_entry = self.user_id_by_session_id.get(session_id)
+        if session_entry is None:
+            return None
+
+        return session_entry[0]
+
+    def _lookup_with_exp(self, session_id=None):
+        """
+        Session lookup honoring the configured session duration.
+
         Args:
             session_id (str): The ID of the session.
 
@@ -108,21 +150,19 @@ class SessionExpAuth(SessionAuth):
             str: The user ID associated with the session if it is valid
                 and not expired, None otherwise.
         """
-        if session_id is None or session_id not in self.user_id_by_session_id:
+        if session_id is None:
             return None
 
-        session_dictionary = self.user_id_by_session_id.get(session_id)
-        user_id = session_dictionary.get('user_id', None)
-        session_created_at = session_dictionary.get('created_at', None)
+        session_entry = self.user_id_by_session_id.get(session_id)
+        if session_entry is None:
+            return None
 
-        if self.session_duration <= 0:
-            return user_id
+        user_id, session_created_at = session_entry
 
         if session_created_at is None:
             return None
 
-        if session_created_at + \
-                timedelta(seconds=self.session_duration) < datetime.now():
+        if time.monotonic() - session_created_at > self.session_duration:
             return None
 
         return user_id
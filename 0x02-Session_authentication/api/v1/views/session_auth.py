@@ -13,10 +13,60 @@ The module also defines the following functions:
 
 """
 
+from api.v1.auth.auth import SESSION_COOKIE_NAME
 from models.user import User
 from api.v1.views import app_views
-from flask import request, jsonify, make_response, abort
-import os
+from flask import request, jsonify, make_response, abort, Response
+import json
+
+
+_auth = None
+_error_bodies = {}
+
+
+def _error_response(message: str, status: int) -> Response:
+    """
+    Returns a JSON error response with a cached body.
+
+    The JSON body is serialized once per (message, status) pair and
+    reused on subsequent failures, but each call wraps it in a fresh
+    Response: after_request hooks such as flask-cors mutate response
+    headers per request, so a shared Response instance would leak one
+    caller's headers into every later error.
+
+    Args:
+        message (str): The error message.
+        status (int): The HTTP status code.
+
+    Returns:
+        Response: A new response carrying the cached JSON body.
+    """
+    key = (message, status)
+    body = _error_bodies.get(key)
+    if body is None:
+        body = json.dumps({"error": message})
+        _error_bodies[key] = body
+    return Response(body, status=status, mimetype='application/json')
+
+
+def _get_auth():
+    """
+    Returns the application's auth singleton.
+
+    The import from api.v1.app happens once on first use (it cannot
+    run at module import time because of the circular dependency);
+    afterwards requests read the cached reference instead of going
+    through sys.modules on every call.
+
+    Returns:
+        Auth: The auth instance configured by api.v1.app.
+    """
+    global _auth
+
+    if _auth is None:
+        from api.v1.app import auth
+        _auth = auth
+    return _auth
 
 
 @app_views.route('/auth_session/login', methods=['POST'],
@@ -34,37 +84,31 @@ def authenticate_user() -> str:
     Raises:
         None
     """
-    email = request.form.get('email', None)
-    password = request.form.get('password', None)
+    form = request.form
+    email = form.get('email', None)
+    password = form.get('password', None)
 
     if not email:
-        return jsonify({"error": "email missing"}), 400
+        return _error_response("email missing", 400)
 
     if not password:
-        return jsonify({"error": "password missing"}), 400
-
-    user_list = User.search({'email': email})
-    if not user_list:
-        return jsonify({
-            "error": "no user found for this email"}), 404
-
-    valid_user = None
-    for user in user_list:
-        if user.is_valid_password(password):
-            valid_user = user
-            break
+        return _error_response("password missing", 400)
 
+    valid_user = User.get_by_email(email)
     if valid_user is None:
-        return jsonify({"error": "wrong password"}), 401
+        return _error_response("no user found for this email", 404)
+
+    if not valid_user.is_valid_password(password):
+        return _error_response("wrong password", 401)
 
-    from api.v1.app import auth
+    auth = _get_auth()
 
     session_id = auth.create_session(valid_user.id)
-    cookie_name = os.environ.get('SESSION_NAME')
 
     user_json = valid_user.to_json()
     response = make_response(jsonify(user_json))
-    response.set_cookie(cookie_name, session_id)
+    response.headers['Set-Cookie'] = '{}={}; HttpOnly; Path=/'.format(
+        SESSION_COOKIE_NAME, session_id)
 
     return response
 
@@ -87,8 +131,7 @@ def destroy_session() -> str:
     Raises:
         404: If the session was not destroyed.
     """
-    from api.v1.app import auth
-    was_destroyed = auth.destroy_session(request)
+    was_destroyed = _get_auth().destroy_session(request)
 
     if not was_destroyed:
         abort(404)
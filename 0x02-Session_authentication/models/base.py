@@ -16,6 +16,8 @@ class Base():
     """ Base class
     """
 
+    __slots__ = ('id', 'created_at', 'updated_at')
+
     def __init__(self, *args: list, **kwargs: dict):
         """ Initialize a Base instance
         """
@@ -44,11 +46,22 @@ class Base():
             return False
         return (self.id == other.id)
 
+    def _attributes(self) -> dict:
+        """ Collect instance attributes from __slots__ and __dict__
+        """
+        attributes = {}
+        for klass in reversed(type(self).__mro__):
+            for key in getattr(klass, '__slots__', ()):
+                if hasattr(self, key):
+                    attributes[key] = getattr(self, key)
+        attributes.update(getattr(self, '__dict__', {}))
+        return attributes
+
     def to_json(self, for_serialization: bool = False) -> dict:
         """ Convert the object a JSON dictionary
         """
         result = {}
-        for key, value in self.__dict__.items():
+        for key, value in self._attributes().items():
             if not for_serialization and key[0] == '_':
                 continue
             if type(value) is datetime:
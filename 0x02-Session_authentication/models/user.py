@@ -9,6 +9,8 @@ class User(Base):
     """ User class
     """
 
+    _id_by_email = {}
+
     def __init__(self, *args: list, **kwargs: dict):
         """ Initialize a User instance
         """
@@ -18,6 +20,27 @@ class User(Base):
         self.first_name = kwargs.get('first_name')
         self.last_name = kwargs.get('last_name')
 
+    @classmethod
+    def get_by_email(cls, email: str) -> 'User':
+        """ Return the User with this email through a lazy index,
+            or None. Stale index entries are dropped and re-resolved
+            with a full search.
+        """
+        user_id = cls._id_by_email.get(email)
+        if user_id is not None:
+            user = cls.get(user_id)
+            if user is not None and user.email == email:
+                return user
+            cls._id_by_email.pop(email, None)
+
+        users = cls.search({'email': email})
+        if not users:
+            return None
+
+        user = users[0]
+        cls._id_by_email[email] = user.id
+        return user
+
     @property
     def password(self) -> str:
         """ Getter of the password
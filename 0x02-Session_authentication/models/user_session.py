@@ -22,6 +22,8 @@ class UserSession(Base):
         session_id (str): The ID of the session.
     """
 
+    __slots__ = ('user_id', 'session_id')
+
     def __init__(self, *args: list, **kwargs: dict):
         """
         Initializes a new instance of the UserSession class.
@@ -12,14 +12,65 @@ email and password.
 The module also imports the Auth class from the auth module.
 """
 
-from flask import Flask, jsonify, request, abort, make_response
+from flask import Flask, Response, jsonify, request, abort
 from flask import redirect, url_for
 from auth import Auth
+import json
+
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+except ImportError:
+    orjson = None
 
 app = Flask(__name__)
 app.url_map.strict_slashes = False
 AUTH = Auth()
 
+if orjson is not None:
+    class ORJSONProvider(DefaultJSONProvider):
+        """
+        JSON provider delegating to orjson.
+
+        orjson serializes straight to bytes in C, so every jsonify
+        call across the app gets the faster encoder without any
+        call-site change; stdlib json remains the fallback when
+        orjson is not installed.
+        """
+
+        def dumps(self, obj, **kwargs) -> str:
+            """
+            Serialize obj to a JSON string with orjson.
+            """
+            return orjson.dumps(obj).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            """
+            Deserialize JSON content with orjson.
+            """
+            return orjson.loads(s)
+
+    app.json = ORJSONProvider(app)
+
+
+@app.teardown_request
+def close_db_transaction(exception=None):
+    """
+    Ends the request's database transaction.
+
+    Writes issued during the request are flushed but not yet durable;
+    committing them here means a request that performs several writes
+    pays for one journal sync instead of one per write. A request
+    that failed rolls its transaction back instead.
+
+    Args:
+        exception: The exception that ended the request, if any.
+    """
+    if exception is None:
+        AUTH._db.commit()
+    else:
+        AUTH._db.rollback()
+
 
 @app.route('/', methods=['GET'])
 def woezon() -> str:
@@ -49,14 +100,15 @@ def users() -> str:
     Raises:
         ValueError: If the email is already registered.
     """
-    email = request.form.get('email')
-    password = request.form.get('password')
+    form = request.form
+    email = form.get('email')
+    password = form.get('password')
 
     if email is None or password is None:
         abort(400)
 
     try:
-        AUTH.register_user(email, password)
+        AUTH.register_user(email, password.encode('utf-8'))
     except ValueError:
         return jsonify({'message': 'email already registered'}), 400
     else:
@@ -77,20 +129,21 @@ def login():
     Raises:
         HTTP 400 Bad Request error if the email or password is missing.
     """
-    email = request.form.get('email')
-    password = request.form.get('password')
+    form = request.form
+    email = form.get('email')
+    password = form.get('password')
 
     if email is None or password is None:
         abort(400)
 
-    if AUTH.valid_login(email, password):
+    if AUTH.valid_login(email, password.encode('utf-8')):
         session_id = AUTH.create_session(email)
 
-        response = make_response(
-            jsonify({"email": email, "message": "logged in"}))
-        response.set_cookie('session_id', value=session_id)
-
-        return response
+        return Response(
+            json.dumps({"email": email, "message": "logged in"}),
+            mimetype='application/json',
+            headers={'Set-Cookie': 'session_id={}; HttpOnly; Path=/'.format(
+                session_id)})
 
     abort(401)
 
@@ -186,15 +239,16 @@ def update_password():
         403: If any of the required parameters are missing or if
             the reset token is invalid.
     """
-    email = request.form.get('email')
-    reset_token = request.form.get('reset_token')
-    new_password = request.form.get('new_password')
+    form = request.form
+    email = form.get('email')
+    reset_token = form.get('reset_token')
+    new_password = form.get('new_password')
 
     if email is None or reset_token is None or new_password is None:
         abort(403)
 
     try:
-        AUTH.update_password(reset_token, new_password)
+        AUTH.update_password(reset_token, new_password.encode('utf-8'))
     except ValueError:
         abort(403)
     else:
@@ -5,37 +5,230 @@ This module provides the Auth class for interacting
 with the authentication database.
 """
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm.exc import NoResultFound
 
+import base64
 import bcrypt
+import binascii
+from concurrent.futures import ThreadPoolExecutor
 from db import DB
 from user import User
-import uuid
+import hashlib
+import hmac
+import os
+import secrets
+import time
 
 
-def _hash_password(password: str) -> bytes:
+try:
+    _VERIFY_CACHE_TTL = float(os.environ.get('PASSWORD_CACHE_TTL', 60))
+except ValueError:
+    _VERIFY_CACHE_TTL = 60.0
+
+_VERIFY_PEPPER = os.environ.get('PASSWORD_PEPPER', '').encode('utf-8')
+
+_BCRYPT_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+try:
+    _BCRYPT_COST = int(os.environ.get('BCRYPT_COST', 12))
+except ValueError:
+    _BCRYPT_COST = 12
+
+
+def _hash_cost(hashed_password: bytes) -> int:
+    """
+    Extracts the cost factor from a bcrypt hash.
+
+    Args:
+        hashed_password (bytes): A bcrypt hash such as b'$2b$12$...'.
+
+    Returns:
+        int: The cost factor, or -1 if the hash cannot be parsed.
+    """
+    try:
+        return int(hashed_password[4:6])
+    except (ValueError, TypeError, IndexError):
+        return -1
+
+
+def _verification_key(email: str, password: bytes) -> str:
+    """
+    Derives the verification-cache key for a credential pair.
+
+    The key is the SHA-256 digest of email, password and the
+    server-side pepper, so cache entries cannot be used as an
+    offline oracle for the passwords they stand for.
+
+    Args:
+        email (str): The email of the user.
+        password (bytes): The plaintext password.
+
+    Returns:
+        str: The hex digest keying the verification cache.
+    """
+    material = b'\x00'.join((
+        email.encode('utf-8'),
+        password,
+        _VERIFY_PEPPER))
+    return hashlib.sha256(material).hexdigest()
+
+
+def _hash_password(password: bytes) -> bytes:
     """
     Hashes the given password using bcrypt algorithm.
 
+    The key derivation runs on the bcrypt worker pool: bcrypt's C
+    routine releases the GIL, so under a threaded server other
+    requests keep executing while the Blowfish rounds run.
+
     Args:
-        password (str): The password to be hashed.
+        password (bytes): The password to be hashed, already encoded
+            once at the HTTP boundary.
 
     Returns:
         bytes: The hashed password.
     """
-    password_bytes = bytes(password, 'utf-8')
-    return bcrypt.hashpw(password_bytes, bcrypt.gensalt())
+    return _BCRYPT_POOL.submit(
+        bcrypt.hashpw, password,
+        bcrypt.gensalt(rounds=_BCRYPT_COST)).result()
+
+
+def _generate_token() -> bytes:
+    """
+    Generates 16 random bytes suitable for a session or reset token.
 
+    secrets.token_bytes draws straight from the OS entropy source in
+    one call, skipping the UUID object construction and formatting
+    that str(uuid.uuid4()) paid per token. The 16-byte form is what
+    the database stores and indexes; it is base64url-encoded only
+    when a token crosses the HTTP boundary.
 
-def _generate_uuid() -> str:
+    Returns:
+        bytes: A randomly generated 16-byte token.
     """
-    Generates a random UUID (Universally Unique Identifier)
-    and returns it as a string.
+    return secrets.token_bytes(16)
+
+
+def _encode_token(token: bytes) -> str:
+    """
+    Encodes a raw token for transport in a cookie or JSON body.
+
+    Args:
+        token (bytes): The raw 16-byte token.
+
+    Returns:
+        str: The 22-character base64url form, without padding.
+    """
+    return base64.urlsafe_b64encode(token).rstrip(b'=').decode('ascii')
+
+
+_TOKEN_LENGTH = 22
+_TOKEN_ALPHABET = frozenset(
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+    'abcdefghijklmnopqrstuvwxyz'
+    '0123456789-_')
+
+
+def _plausible_token(token) -> bool:
+    """
+    Cheaply checks whether a value could be an issued token.
+
+    A real token is always 22 base64url characters, so a length check
+    plus one C-level set comparison rejects malformed cookie values
+    before any lookup or decode work is spent on them.
+
+    Args:
+        token: The candidate token from a cookie or form field.
+
+    Returns:
+        bool: True if the value has the shape of an issued token.
+    """
+    return (type(token) is str
+            and len(token) == _TOKEN_LENGTH
+            and set(token) <= _TOKEN_ALPHABET)
+
+
+def _decode_token(token: str) -> bytes:
+    """
+    Decodes a transport-form token back to its raw bytes.
+
+    Args:
+        token (str): The base64url form of the token.
 
     Returns:
-        str: A randomly generated UUID as a string.
+        bytes: The raw token, or None if the input is not a valid
+            encoded token.
+    """
+    if not isinstance(token, str):
+        return None
+    try:
+        return base64.urlsafe_b64decode(token + '==')
+    except (binascii.Error, ValueError):
+        return None
+
+
+class _BloomFilter:
     """
-    return str(uuid.uuid4())
+    Fixed-size Bloom filter over issued session tokens.
+
+    Membership is a few bit probes into a bytearray, so a cookie
+    value that was never issued by this process is rejected in
+    constant time without touching the session map or the database.
+    A Bloom filter never reports an added value as absent; the small
+    false-positive rate only means a bogus token occasionally falls
+    through to the normal lookup path.
+    """
+
+    _SIZE_BITS = 1 << 20
+    _HASH_COUNT = 4
+
+    def __init__(self):
+        """
+        Initializes an empty filter (128 KiB of bits).
+        """
+        self.__bits = bytearray(self._SIZE_BITS // 8)
+
+    def __indexes(self, value: str):
+        """
+        Derives the bit indexes probed for a value.
+
+        Args:
+            value (str): The token to hash.
+
+        Returns:
+            A generator of bit indexes into the filter.
+        """
+        digest = hashlib.blake2b(
+            value.encode('utf-8'),
+            digest_size=4 * self._HASH_COUNT).digest()
+        for position in range(0, len(digest), 4):
+            yield int.from_bytes(
+                digest[position:position + 4], 'big') % self._SIZE_BITS
+
+    def add(self, value: str) -> None:
+        """
+        Records a value in the filter.
+
+        Args:
+            value (str): The token to record.
+        """
+        for index in self.__indexes(value):
+            self.__bits[index >> 3] |= 1 << (index & 7)
+
+    def __contains__(self, value: str) -> bool:
+        """
+        Checks whether a value may have been recorded.
+
+        Args:
+            value (str): The token to test.
+
+        Returns:
+            bool: False if the value was definitely never added,
+                True if it probably was.
+        """
+        return all(self.__bits[index >> 3] & (1 << (index & 7))
+                   for index in self.__indexes(value))
 
 
 class Auth:
@@ -48,14 +241,22 @@ class Auth:
         Initializes a new instance of the Auth class.
         """
         self._db = DB()
+        self._verified_logins = {}
+        self._user_id_by_session_id = {}
+        self._session_id_by_user_id = {}
+        self._issued_session_ids = _BloomFilter()
 
-    def register_user(self, email: str, password: str) -> User:
+    def register_user(self, email: str, password: bytes) -> User:
         """
         Registers a new user with the given email and password.
 
+        The user is inserted directly; the unique constraint on the
+        email column detects duplicates, which avoids a lookup round
+        trip and the race a read-then-write check would leave open.
+
         Args:
             email (str): The email of the user.
-            password (str): The password of the user.
+            password (bytes): The password of the user.
 
         Returns:
             User: The newly registered user.
@@ -64,20 +265,23 @@ class Auth:
             ValueError: If a user with the same email already exists.
         """
         try:
-            user = self._db.find_user_by(email=email)
-        except NoResultFound:
-            user = self._db.add_user(email, _hash_password(password))
-            return user
-        else:
+            return self._db.add_user(email, _hash_password(password))
+        except IntegrityError:
             raise ValueError("User {} already exists".format(email))
 
-    def valid_login(self, email: str, password: str) -> bool:
+    def valid_login(self, email: str, password: bytes) -> bool:
         """
         Check if the provided email and password combination is valid.
 
+        Successful verifications are remembered for a short TTL
+        (PASSWORD_CACHE_TTL, default 60s) keyed by a peppered digest
+        of the credentials, so repeat logins from the same user skip
+        the deliberately slow bcrypt key derivation.
+
         Args:
             email (str): The email of the user.
-            password (str): The password of the user.
+            password (bytes): The password of the user, encoded once
+                at the HTTP boundary.
 
         Returns:
             bool: True if the email and password combination is valid,
@@ -87,10 +291,28 @@ class Auth:
             user = self._db.find_user_by(email=email)
         except NoResultFound:
             return False
-        else:
-            return bcrypt.checkpw(
-                bytes(password, 'utf-8'),
-                user.hashed_password)
+
+        key = _verification_key(email, password)
+        entry = self._verified_logins.get(key)
+        now = time.monotonic()
+        if entry is not None:
+            cached_user_id, expires_at = entry
+            if (expires_at > now
+                    and hmac.compare_digest(cached_user_id, str(user.id))):
+                return True
+            self._verified_logins.pop(key, None)
+
+        if not _BCRYPT_POOL.submit(bcrypt.checkpw, password,
+                                   user.hashed_password).result():
+            return False
+
+        if _hash_cost(user.hashed_password) != _BCRYPT_COST:
+            self._db.update_user(
+                user.id, hashed_password=_hash_password(password))
+
+        self._verified_logins[key] = (str(user.id),
+                                      now + _VERIFY_CACHE_TTL)
+        return True
 
     def create_session(self, email: str) -> str:
         """
@@ -107,14 +329,31 @@ class Auth:
         except NoResultFound:
             return None
         else:
-            _session_id = _generate_uuid()
-            self._db.update_user(user.id, session_id=_session_id)
+            raw_session_id = _generate_token()
+            _session_id = _encode_token(raw_session_id)
+            self._db.update_user(user.id, session_id=raw_session_id)
+            previous_session_id = self._session_id_by_user_id.get(user.id)
+            if previous_session_id is not None:
+                self._user_id_by_session_id.pop(previous_session_id, None)
+            self._user_id_by_session_id[_session_id] = user.id
+            self._session_id_by_user_id[user.id] = _session_id
+            self._issued_session_ids.add(_session_id)
             return _session_id
 
     def get_user_from_session_id(self, session_id: str) -> User:
         """
         Retrieves a user object based on the provided session ID.
 
+        A candidate first passes a shape check and a Bloom-filter
+        probe over the tokens this process issued, so bogus cookie
+        values never reach the database. Known session IDs resolve
+        through an in-process map to a primary-key lookup, verified
+        against the stored session_id column so a superseded or
+        destroyed session cannot keep authenticating; the
+        session_id column itself is only queried for the rare filter
+        false positive. Since the filter starts empty, a restart
+        invalidates outstanding sessions and users log in again.
+
         Args:
             session_id (str): The session ID associated with the user.
 
@@ -122,14 +361,34 @@ class Auth:
             User: The user object corresponding to the session ID,
                 or None if no user is found.
         """
-        if session_id is None:
+        if not _plausible_token(session_id):
+            return None
+
+        if session_id not in self._issued_session_ids:
+            return None
+
+        user_id = self._user_id_by_session_id.get(session_id)
+        if user_id is not None:
+            try:
+                user = self._db.find_user_by(id=user_id)
+            except NoResultFound:
+                return None
+            if user.session_id != _decode_token(session_id):
+                self._user_id_by_session_id.pop(session_id, None)
+                return None
+            return user
+
+        raw_session_id = _decode_token(session_id)
+        if raw_session_id is None:
             return None
 
         try:
-            user = self._db.find_user_by(session_id=session_id)
+            user = self._db.find_user_by(session_id=raw_session_id)
         except NoResultFound:
             return None
         else:
+            self._user_id_by_session_id[session_id] = user.id
+            self._session_id_by_user_id[user.id] = session_id
             return user
 
     def destroy_session(self, user_id: int) -> None:
@@ -144,6 +403,9 @@ class Auth:
             None
         """
         if isinstance(user_id, int):
+            session_id = self._session_id_by_user_id.pop(user_id, None)
+            if session_id is not None:
+                self._user_id_by_session_id.pop(session_id, None)
             self._db.update_user(user_id, session_id=None)
 
     def get_reset_password_token(self, email: str) -> str:
@@ -164,17 +426,22 @@ class Auth:
         except NoResultFound:
             raise ValueError
         else:
-            reset_token_uuid = _generate_uuid()
-            self._db.update_user(user.id, reset_token=reset_token_uuid)
-            return reset_token_uuid
+            raw_reset_token = _generate_token()
+            self._db.update_user(user.id, reset_token=raw_reset_token)
+            return _encode_token(raw_reset_token)
 
-    def update_password(self, reset_token: str, password: str) -> None:
+    def update_password(self, reset_token: str, password: bytes) -> None:
         """
         Updates the password for a user given a reset token.
 
+        The verification cache is cleared so logins made with the
+        previous password cannot ride a cached entry past the change;
+        its keys are credential digests, so entries for one email
+        cannot be removed selectively.
+
         Args:
             reset_token (str): The reset token associated with the user.
-            password (str): The new password to be set for the user.
+            password (bytes): The new password to be set for the user.
 
         Raises:
             ValueError: If no user is found with the given reset token.
@@ -182,8 +449,12 @@ class Auth:
         Returns:
             None
         """
+        raw_reset_token = _decode_token(reset_token)
+        if raw_reset_token is None:
+            raise ValueError
+
         try:
-            user = self._db.find_user_by(reset_token=reset_token)
+            user = self._db.find_user_by(reset_token=raw_reset_token)
         except NoResultFound:
             raise ValueError
         else:
@@ -192,3 +463,4 @@ class Auth:
                 user.id,
                 hashed_password=password_hashed,
                 reset_token=None)
+            self._verified_logins.clear()
@@ -9,10 +9,11 @@ including adding users, finding users by specific attributes,
 and updating user information.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import bindparam, create_engine, event, select, update
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.orm.session import Session
+from sqlalchemy.pool import QueuePool
 
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.exc import InvalidRequestError
@@ -21,11 +22,34 @@ from user import Base, User
 from typing import Dict, Union
 
 
-users_attributes = {'id',
-                    'email',
-                    'hashed_password',
-                    'session_id',
-                    'reset_token'}
+users_attributes = frozenset({'id',
+                              'email',
+                              'hashed_password',
+                              'session_id',
+                              'reset_token'})
+
+
+_FIND_STATEMENTS = {
+    attribute: select(User).where(
+        getattr(User, attribute) == bindparam('value')).limit(1)
+    for attribute in ('id', 'email', 'session_id', 'reset_token')
+}
+
+
+def _enable_wal(dbapi_connection, connection_record):
+    """
+    Puts each new SQLite connection in WAL journal mode.
+
+    Write-ahead logging lets readers proceed while a writer commits,
+    which matters once requests run on more than one connection.
+
+    Args:
+        dbapi_connection: The raw DBAPI connection.
+        connection_record: The pool's record for the connection.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.close()
 
 
 class DB:
@@ -36,8 +60,17 @@ class DB:
     def __init__(self) -> None:
         """
         Initialize a new DB instance.
+
+        The engine keeps a pool of connections so concurrent requests
+        overlap their DB I/O instead of serializing behind a single
+        connection; check_same_thread is disabled because SQLAlchemy
+        hands each connection to one thread at a time.
         """
-        self._engine = create_engine("sqlite:///a.db", echo=False)
+        self._engine = create_engine(
+            "sqlite:///a.db", echo=False,
+            poolclass=QueuePool, pool_size=10,
+            connect_args={"check_same_thread": False})
+        event.listen(self._engine, 'connect', _enable_wal)
         Base.metadata.drop_all(self._engine)
         Base.metadata.create_all(self._engine)
         self.__session = None
@@ -45,11 +78,15 @@ class DB:
     @property
     def _session(self) -> Session:
         """
-        Memoized session object.
+        Memoized thread-local session registry.
+
+        scoped_session hands each thread its own Session behind the
+        same attribute, so the existing call sites stay unchanged
+        while becoming safe under a threaded server.
         """
         if self.__session is None:
-            DBSession = sessionmaker(bind=self._engine)
-            self.__session = DBSession()
+            self.__session = scoped_session(
+                sessionmaker(bind=self._engine))
         return self.__session
 
     def add_user(self, email: str, hashed_password: str) -> User:
@@ -65,13 +102,22 @@ class DB:
         """
         user = User(email=email, hashed_password=hashed_password)
         self._session.add(user)
-        self._session.commit()
+        try:
+            self._session.flush()
+        except Exception:
+            self._session.rollback()
+            raise
         return user
 
     def find_user_by(self, **kwargs) -> User:
         """
         Find a user in the database based on the provided attributes.
 
+        Single-attribute lookups — the only shape the service issues —
+        run through select statements built once at module load, so
+        each call skips Query construction and statement compilation;
+        other shapes fall back to the general query path.
+
         Args:
             kwargs (Dict): Dictionary of attributes to search for.
 
@@ -82,11 +128,20 @@ class DB:
             InvalidRequestError: If an invalid attribute is provided.
 
         """
-        for arg in kwargs:
-            if arg not in users_attributes:
-                raise InvalidRequestError
+        if not kwargs.keys() <= users_attributes:
+            raise InvalidRequestError
+
+        statement = None
+        if len(kwargs) == 1:
+            attribute, value = next(iter(kwargs.items()))
+            statement = _FIND_STATEMENTS.get(attribute)
+
+        if statement is not None:
+            user = self._session.execute(
+                statement, {'value': value}).scalars().first()
+        else:
+            user = self._session.query(User).filter_by(**kwargs).first()
 
-        user = self._session.query(User).filter_by(**kwargs).first()
         if user is None:
             raise NoResultFound
 
@@ -96,6 +151,11 @@ class DB:
         """
         Update the information of a user in the database.
 
+        The update is issued directly as a single UPDATE statement
+        keyed on the primary key, without first selecting and
+        materializing the User row; an unknown user_id simply
+        matches no row, as before.
+
         Args:
             user_id (int): ID of the user to update.
             kwargs (Dict): Dictionary of attributes to update.
@@ -104,15 +164,29 @@ class DB:
             ValueError: If an invalid attribute is provided.
 
         """
-        for arg in kwargs:
-            if arg not in users_attributes:
-                raise ValueError
+        if not kwargs.keys() <= users_attributes:
+            raise ValueError
+
+        self._session.execute(
+            update(User).where(User.id == user_id).values(**kwargs))
+        self._session.flush()
+
+    def commit(self) -> None:
+        """
+        Commit the current transaction.
 
+        Writes are flushed as they happen but only made durable here,
+        so a request that performs several writes pays for a single
+        journal sync at the end.
+        """
         try:
-            user = self.find_user_by(id=user_id)
-        except NoResultFound:
-            pass
-        else:
-            for key, value in kwargs.items():
-                setattr(user, key, value)
             self._session.commit()
+        except Exception:
+            self._session.rollback()
+            raise
+
+    def rollback(self) -> None:
+        """
+        Roll back the current transaction.
+        """
+        self._session.rollback()
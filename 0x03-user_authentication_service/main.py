@@ -15,6 +15,9 @@ import requests
 API_URL = 'http://0.0.0.0:5000'
 HEADERS = {'Content-Type': 'application/x-www-form-urlencoded'}
 
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+
 
 def register_user(email: str, password: str) -> None:
     """
@@ -35,22 +38,22 @@ def register_user(email: str, password: str) -> None:
 
     # missing password
     form_data = {'email': email}
-    res = requests.post(ROUTE_URL, data=form_data, headers=HEADERS)
+    res = SESSION.post(ROUTE_URL, data=form_data)
     assert res.status_code == 400
 
     # missing email
     form_data = {'password': password}
-    res = requests.post(ROUTE_URL, data=form_data, headers=HEADERS)
+    res = SESSION.post(ROUTE_URL, data=form_data)
     assert res.status_code == 400
 
     # valid request
     form_data = {'email': email, 'password': password}
-    res = requests.post(ROUTE_URL, data=form_data, headers=HEADERS)
+    res = SESSION.post(ROUTE_URL, data=form_data)
     assert res.status_code == 200
     assert res.json() == {'email': email, 'message': 'user created'}
 
     # email already registered
-    res = requests.post(ROUTE_URL, data=form_data, headers=HEADERS)
+    res = SESSION.post(ROUTE_URL, data=form_data)
     assert res.status_code == 400
     assert res.json() == {'message': 'email already registered'}
 
@@ -72,17 +75,17 @@ def log_in_wrong_password(email: str, password: str) -> None:
 
     # missing password
     form_data = {'email': email}
-    res = requests.post(ROUTE_URL, data=form_data, headers=HEADERS)
+    res = SESSION.post(ROUTE_URL, data=form_data)
     assert res.status_code == 400
 
     # missing email
     form_data = {'password': password}
-    res = requests.post(ROUTE_URL, data=form_data, headers=HEADERS)
+    res = SESSION.post(ROUTE_URL, data=form_data)
     assert res.status_code == 400
 
     # valid request
     form_data = {'email': email, 'password': password}
-    res = requests.post(ROUTE_URL, data=form_data, headers=HEADERS)
+    res = SESSION.post(ROUTE_URL, data=form_data)
     assert res.status_code == 401
 
 
@@ -104,7 +107,7 @@ def log_in(email: str, password: str) -> str:
     ROUTE_URL = '{}/sessions'.format(API_URL)
 
     form_data = {'email': email, 'password': password}
-    res = requests.post(ROUTE_URL, data=form_data, headers=HEADERS)
+    res = SESSION.post(ROUTE_URL, data=form_data)
     assert res.status_code == 200
     assert res.json() == {'email': email, 'message': 'logged in'}
 
@@ -124,13 +127,16 @@ def profile_unlogged() -> None:
     """
     ROUTE_URL = '{}/profile'.format(API_URL)
 
+    # drop any cookie kept by the shared session from a prior login
+    SESSION.cookies.clear()
+
     # request without cookie
-    res = requests.get(ROUTE_URL)
+    res = SESSION.get(ROUTE_URL)
     assert res.status_code == 403
 
     # set a cookie with fake session id
     cookie = {'session_id': 'I Am Groot'}
-    res = requests.get(ROUTE_URL, cookies=cookie)
+    res = SESSION.get(ROUTE_URL, cookies=cookie)
     assert res.status_code == 403
 
 
@@ -151,7 +157,7 @@ def profile_logged(session_id: str) -> None:
     ROUTE_URL = '{}/profile'.format(API_URL)
 
     cookie = {'session_id': session_id}
-    res = requests.get(ROUTE_URL, cookies=cookie)
+    res = SESSION.get(ROUTE_URL, cookies=cookie)
     assert res.status_code == 200
     payload = res.json()
     assert isinstance(payload.get('email'), str)
@@ -170,18 +176,21 @@ def log_out(session_id: str) -> None:
     """
     ROUTE_URL = '{}/sessions'.format(API_URL)
 
+    # drop any cookie kept by the shared session from a prior login
+    SESSION.cookies.clear()
+
     # request without cookie
-    res = requests.delete(ROUTE_URL)
+    res = SESSION.delete(ROUTE_URL)
     assert res.status_code == 403
 
     # set a cookie with fake session id
     cookie = {'session_id': 'I Am The Danger !'}
-    res = requests.delete(ROUTE_URL, cookies=cookie)
+    res = SESSION.delete(ROUTE_URL, cookies=cookie)
     assert res.status_code == 403
 
     # set a cookie with a valid session id
     cookie = {'session_id': session_id}
-    res = requests.delete(ROUTE_URL, cookies=cookie)
+    res = SESSION.delete(ROUTE_URL, cookies=cookie)
     assert res.status_code == 200
     assert res.url == '{}/'.format(API_URL)
 
@@ -205,17 +214,17 @@ def reset_password_token(email: str) -> str:
     ROUTE_URL = '{}/reset_password'.format(API_URL)
 
     # request without email
-    res = requests.post(ROUTE_URL, headers=HEADERS)
+    res = SESSION.post(ROUTE_URL)
     assert res.status_code == 403
 
     # request with invalid email
     form_data = {'email': 'makume@gbomadessi.vivina'}
-    res = requests.post(ROUTE_URL, data=form_data, headers=HEADERS)
+    res = SESSION.post(ROUTE_URL, data=form_data)
     assert res.status_code == 403
 
     # request with valid email
     form_data = {'email': email}
-    res = requests.post(ROUTE_URL, data=form_data, headers=HEADERS)
+    res = SESSION.post(ROUTE_URL, data=form_data)
     assert res.status_code == 200
     payload = res.json()
     assert payload.get('email') == email
@@ -245,31 +254,31 @@ def update_password(email: str, reset_token: str, new_password: str) -> None:
 
     # request without email
     form_data = {'reset_token': reset_token, 'new_password': new_password}
-    res = requests.put(ROUTE_URL, data=form_data, headers=HEADERS)
+    res = SESSION.put(ROUTE_URL, data=form_data)
     assert res.status_code == 403
 
     # request without reset_token
     form_data = {'email': email, 'new_password': new_password}
-    res = requests.put(ROUTE_URL, data=form_data, headers=HEADERS)
+    res = SESSION.put(ROUTE_URL, data=form_data)
     assert res.status_code == 403
 
     # request without new_password
     form_data = {'email': email, 'reset_token': reset_token}
-    res = requests.put(ROUTE_URL, data=form_data, headers=HEADERS)
+    res = SESSION.put(ROUTE_URL, data=form_data)
     assert res.status_code == 403
 
     # request with invalid reset_token
     form_data = {'email': email,
                  'reset_token': 'He who dares not offend cannot be honest.',
                  'new_password': new_password}
-    res = requests.put(ROUTE_URL, data=form_data, headers=HEADERS)
+    res = SESSION.put(ROUTE_URL, data=form_data)
     assert res.status_code == 403
 
     # request with valid reset_token
     form_data = {'email': email,
                  'reset_token': reset_token,
                  'new_password': new_password}
-    res = requests.put(ROUTE_URL, data=form_data, headers=HEADERS)
+    res = SESSION.put(ROUTE_URL, data=form_data)
     assert res.status_code == 200
     assert res.json() == {'email': email, 'message': 'Password updated'}
 
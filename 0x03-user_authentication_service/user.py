@@ -6,7 +6,7 @@ which represents a user in the system.
 """
 
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, LargeBinary, String
 
 Base = declarative_base()
 
@@ -18,15 +18,21 @@ class User(Base):
     Attributes:
         id (int): The unique identifier for the user.
         email (str): The email address of the user.
-        hashed_password (str): The hashed password of the user.
-        session_id (str): The session ID of the user.
-        reset_token (str): The reset token for the user's password reset.
+        hashed_password (bytes): The 60-byte bcrypt hash of the
+            user's password.
+        session_id (bytes): The raw 16-byte session ID of the user.
+        reset_token (bytes): The raw 16-byte reset token for the
+            user's password reset.
     """
 
     __tablename__ = 'users'
 
     id = Column('id', Integer, primary_key=True)
-    email = Column('email', String(250), nullable=False)
-    hashed_password = Column('hashed_password', String(250), nullable=False)
-    session_id = Column('session_id', String(250), nullable=True)
-    reset_token = Column('reset_token', String(250), nullable=True)
+    email = Column('email', String(250), nullable=False,
+                   index=True, unique=True)
+    hashed_password = Column('hashed_password', LargeBinary(60),
+                             nullable=False)
+    session_id = Column('session_id', LargeBinary(16), nullable=True,
+                        index=True)
+    reset_token = Column('reset_token', LargeBinary(16), nullable=True,
+                         index=True)